@@ -48,6 +48,10 @@ try:
         "ecdsa-sha2-nistp384": ec.ECDSA(hashes.SHA384()),
     }
 
+    # pyca/cryptography's default backend, fetched once and shared by all calls
+    # in this module.
+    _BACKEND = default_backend()
+
 except ImportError:
     CRYPTO = False
 
@@ -139,7 +143,7 @@ def generate_public_and_private(scheme="ecdsa-sha2-nistp256"):
     # only currently supported ECDSA signature scheme.  Nevertheness, include the
     # conditional statement to accomodate any schemes that might be added.
     if scheme == "ecdsa-sha2-nistp256":
-        private_key = ec.generate_private_key(ec.SECP256R1, default_backend())
+        private_key = ec.generate_private_key(ec.SECP256R1, _BACKEND)
         public_key = private_key.public_key()
 
     # The ECDSA_SCHEME_SCHEMA.check_match() above should have detected any
@@ -240,7 +244,7 @@ def create_signature(
             private_key = load_pem_private_key(
                 private_key.encode("utf-8"),
                 password=None,
-                backend=default_backend(),
+                backend=_BACKEND,
             )
 
             signature = private_key.sign(data, ec.ECDSA(hashes.SHA256()))
@@ -320,7 +324,7 @@ def verify_signature(public_key, scheme, signature, data):
 
     try:
         ecdsa_key = load_pem_public_key(
-            public_key.encode("utf-8"), backend=default_backend()
+            public_key.encode("utf-8"), backend=_BACKEND
         )
     except ValueError as e:
         raise exceptions.FormatError(
@@ -423,7 +427,7 @@ def create_ecdsa_public_and_private_from_pem(pem, password=None):
     # performs the actual import operation.
     try:
         private = load_pem_private_key(
-            pem.encode("utf-8"), password=password, backend=default_backend()
+            pem.encode("utf-8"), password=password, backend=_BACKEND
         )
 
     except (ValueError, UnsupportedAlgorithm) as e:
@@ -501,7 +505,7 @@ def create_ecdsa_encrypted_pem(private_pem, passphrase):
     formats.PASSWORD_SCHEMA.check_match(passphrase)
 
     private = load_pem_private_key(
-        private_pem.encode("utf-8"), password=None, backend=default_backend()
+        private_pem.encode("utf-8"), password=None, backend=_BACKEND
     )
 
     encrypted_private_pem = private.private_bytes(
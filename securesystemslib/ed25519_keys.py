@@ -89,7 +89,7 @@ from securesystemslib._vendor.ed25519 import ed25519 as python_ed25519
 _SUPPORTED_ED25519_SIGNING_SCHEMES = ["ed25519"]
 
 
-def generate_public_and_private():
+def generate_public_and_private(seed=None):
     """
     <Purpose>
       Generate a pair of ed25519 public and private keys with PyNaCl.  The public
@@ -107,17 +107,24 @@ def generate_public_and_private():
       True
 
     <Arguments>
-      None.
+      seed:
+        An optional 32-byte seed to derive the key pair from deterministically,
+        conformant to 'securesystemslib.formats.ED25519SEED_SCHEMA'.  Only meant
+        for tests, a fixed seed must never be used for production keys.
 
     <Exceptions>
+      securesystemslib.exceptions.FormatError, if 'seed' is passed and is
+      improperly formatted.
+
       securesystemslib.exceptions.UnsupportedLibraryError, if the PyNaCl ('nacl')
       module is unavailable.
 
       NotImplementedError, if a randomness source is not found by 'os.urandom'.
 
     <Side Effects>
-      The ed25519 keys are generated by first creating a random 32-byte seed
-      with os.urandom() and then calling PyNaCl's nacl.signing.SigningKey().
+      Unless a 'seed' is passed, the ed25519 keys are generated by first
+      creating a random 32-byte seed with os.urandom() and then calling PyNaCl's
+      nacl.signing.SigningKey().
 
     <Returns>
       A (public, private) tuple that conform to
@@ -128,12 +135,17 @@ def generate_public_and_private():
     if not NACL:  # pragma: no cover
         raise exceptions.UnsupportedLibraryError(NO_NACL_MSG)
 
-    # Generate ed25519's seed key by calling os.urandom().  The random bytes
-    # returned should be suitable for cryptographic use and is OS-specific.
-    # Raise 'NotImplementedError' if a randomness source is not found.
-    # ed25519 seed keys are fixed at 32 bytes (256-bit keys).
+    # Generate ed25519's seed key by calling os.urandom(), unless one is passed.
+    # The random bytes returned should be suitable for cryptographic use and is
+    # OS-specific.  Raise 'NotImplementedError' if a randomness source is not
+    # found.  ed25519 seed keys are fixed at 32 bytes (256-bit keys).
     # http://blog.mozilla.org/warner/2011/11/29/ed25519-keys/
-    seed = os.urandom(32)
+    if seed is None:
+        seed = os.urandom(32)
+
+    else:
+        formats.ED25519SEED_SCHEMA.check_match(seed)
+
     public = None
 
     # Generate the public key.  PyNaCl (i.e., 'nacl' module) performs the actual
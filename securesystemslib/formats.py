@@ -157,8 +157,8 @@ HASHALGORITHMS_SCHEMA = SCHEMA.ListOf(
 )
 
 # The contents of an encrypted key.  Encrypted keys are saved to files
-# in this format.
-ENCRYPTEDKEY_SCHEMA = SCHEMA.AnyString()
+# in this format, and may be passed as read from a file (i.e., as bytes).
+ENCRYPTEDKEY_SCHEMA = SCHEMA.OneOf([SCHEMA.AnyString(), SCHEMA.AnyBytes()])
 
 # A value that is either True or False, on or off, etc.
 BOOLEAN_SCHEMA = SCHEMA.Boolean()
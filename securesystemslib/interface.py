@@ -24,8 +24,9 @@ import getpass
 import json
 import logging
 import os
+import stat
 import sys
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 from securesystemslib import (
     KEY_TYPE_ECDSA,
@@ -39,6 +40,14 @@ from securesystemslib import (
 )
 from securesystemslib.storage import FilesystemBackend
 
+try:
+    # Prefer orjson to parse JSON-formatted key files, if it is installed. Like
+    # the standard library parser it accepts bytes and raises a ValueError
+    # subclass on malformed input.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 # Recommended RSA key sizes:
@@ -47,6 +56,32 @@ logger = logging.getLogger(__name__)
 # security through 2031 and beyond.
 DEFAULT_RSA_KEY_BITS = 3072
 
+# Bound schema validators for arguments checked on every key generation and
+# import call. Binding them once saves walking the 'formats' attribute chain on
+# each call.
+_check_path = formats.PATH_SCHEMA.check_match
+_check_password = formats.PASSWORD_SCHEMA.check_match
+_check_rsabits = formats.RSAKEYBITS_SCHEMA.check_match
+_check_rsascheme = formats.RSA_SCHEME_SCHEMA.check_match
+
+# Compact JSON serializer for custom-formatted key files. Whitespace is not
+# significant to the loaders, so it is left out of the files.
+_json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+# Upper bound for the size of key files read by the import functions. Encoded
+# keys are at most a few KB, anything larger is refused before parsing.
+_MAX_KEY_FILE_SIZE = 1 << 20
+
+# Prompt templates for key file passwords, formatted with the key file path.
+_ENCRYPTION_PASSWORD_PROMPT = (
+    "enter password to encrypt private key file '{}' (leave empty if key "
+    "should not be encrypted): "
+)
+_DECRYPTION_PASSWORD_PROMPT = (
+    "enter password to decrypt private key file '{}' "
+    "(leave empty if key not encrypted): "
+)
+
 
 def get_password(prompt="Password: ", confirm=False):
     """Prompts user to enter a password.
@@ -102,23 +137,20 @@ def _get_key_file_encryption_password(password, prompt, path):
     # Prompt user for password and confirmation
     if prompt:
         password = get_password(
-            "enter password to encrypt private key file "
-            "'" + str(path) + "' (leave empty if key "
-            "should not be encrypted): ",
-            confirm=True,
+            _ENCRYPTION_PASSWORD_PROMPT.format(path), confirm=True
         )
 
         # Treat empty password as no password. A user on the prompt can only
         # indicate the desire to not encrypt by entering no password.
-        if not len(password):  # pylint: disable=use-implicit-booleaness-not-len
+        if not password:
             return None
 
     if password is not None:
-        formats.PASSWORD_SCHEMA.check_match(password)
+        _check_password(password)
 
         # Fail on empty passed password. A caller should pass None to indicate the
         # desire to not encrypt.
-        if not len(password):  # pylint: disable=use-implicit-booleaness-not-len
+        if not password:
             raise ValueError(
                 "encryption password must be 1 or more characters long"
             )
@@ -149,24 +181,200 @@ def _get_key_file_decryption_password(password, prompt, path):
     # Prompt user for password
     if prompt:
         password = get_password(
-            "enter password to decrypt private key file "
-            "'" + str(path) + "' "
-            "(leave empty if key not encrypted): ",
-            confirm=False,
+            _DECRYPTION_PASSWORD_PROMPT.format(path), confirm=False
         )
 
         # Treat empty password as no password. A user on the prompt can only
         # indicate the desire to not decrypt by entering no password.
-        if not len(password):  # pylint: disable=use-implicit-booleaness-not-len
+        if not password:
             return None
 
     if password is not None:
-        formats.PASSWORD_SCHEMA.check_match(password)
+        _check_password(password)
         # No additional vetting needed. Decryption will show if it was correct.
 
     return password
 
 
+def _write_key_file(filepath, data, restrict=False):
+    """Atomically writes 'data' bytes to 'filepath'.
+
+    The data is written with a single write call to a new file in the same
+    directory, which is synced to disk and then replaces 'filepath' with
+    'os.replace'. Readers thus never see a partially written key file. If
+    'restrict' is true, the file is created with read and write permissions for
+    the user only.
+
+    Raises:
+      StorageError: The file cannot be written.
+
+    """
+    if restrict:
+        mode = stat.S_IRUSR | stat.S_IWUSR
+    else:
+        mode = stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO
+
+    # Unlike tempfile.mkstemp, which always uses mode 0o600, os.open applies
+    # the passed 'mode' (modified by the umask), so the permissions of the
+    # temporary file carry over to 'filepath'.
+    temp_path = filepath + "." + os.urandom(8).hex() + ".tmp"
+    replaced = False
+
+    try:
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+        with os.fdopen(fd, "wb") as file_object:
+            file_object.write(data)
+            # Make sure the data is on disk before the file is swapped in, so
+            # that a crash cannot leave an empty key file at 'filepath'
+            file_object.flush()
+            os.fsync(file_object.fileno())
+
+        os.replace(temp_path, filepath)
+        replaced = True
+
+    except OSError:
+        raise exceptions.StorageError(  # pylint: disable=raise-missing-from
+            "Can't write file %s"  # pylint: disable=consider-using-f-string
+            % filepath
+        )
+
+    finally:
+        # Remove the temporary file on any error, including interrupts
+        if not replaced:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def _read_key_file(filepath, storage_backend=None):
+    """Reads the contents of a key file as bytes.
+
+    At most '_MAX_KEY_FILE_SIZE' bytes are read. Decoding is left to the caller.
+
+    Raises:
+      StorageError: The file cannot be read or exceeds '_MAX_KEY_FILE_SIZE'.
+
+    """
+    if storage_backend is None:
+        storage_backend = FilesystemBackend()
+
+    with storage_backend.get(filepath) as file_object:
+        data = file_object.read(_MAX_KEY_FILE_SIZE + 1)
+
+    if len(data) > _MAX_KEY_FILE_SIZE:
+        raise exceptions.StorageError(
+            "Key file {} exceeds {} bytes".format(  # pylint: disable=consider-using-f-string
+                filepath, _MAX_KEY_FILE_SIZE
+            )
+        )
+
+    return data
+
+
+def _load_json_key_file(filepath):
+    """Reads a JSON-formatted key file and deserializes it.
+
+    Raises:
+      StorageError: The file cannot be read or exceeds '_MAX_KEY_FILE_SIZE'.
+      Error: The file contents cannot be deserialized.
+
+    """
+    data = _read_key_file(filepath)
+
+    try:
+        return _json_loads(data)
+
+    except (ValueError, TypeError):
+        raise exceptions.Error(  # pylint: disable=raise-missing-from
+            "Cannot deserialize to a Python object: " + filepath
+        )
+
+
+def _serialize_rsa_public(rsa_key):
+    """Returns the PEM-encoded public part of 'rsa_key'."""
+    return rsa_key["keyval"]["public"]
+
+
+def _serialize_rsa_private(rsa_key):
+    """Returns the PEM-encoded private part of 'rsa_key'."""
+    return rsa_key["keyval"]["private"]
+
+
+def _encrypt_rsa_private(rsa_key, password):
+    """Returns the private part of 'rsa_key' as encrypted PEM."""
+    return keys.create_rsa_encrypted_pem(rsa_key["keyval"]["private"], password)
+
+
+def _serialize_custom_public(key_dict):
+    """Returns the public part of 'key_dict' in the custom JSON key format."""
+    key_metadata_format = keys.format_keyval_to_metadata(
+        key_dict["keytype"],
+        key_dict["scheme"],
+        key_dict["keyval"],
+        private=False,
+    )
+    return _json_encode(key_metadata_format)
+
+
+def _serialize_custom_private(key_dict):
+    """Returns 'key_dict', including its private part, as JSON string."""
+    return _json_encode(key_dict)
+
+
+def _write_keypair(
+    key_dict,
+    filepath,
+    password,
+    prompt,
+    *,
+    serialize_public,
+    serialize_private,
+    encrypt_private,
+):
+    """Writes a generated key pair to '<filepath>.pub' and '<filepath>'.
+
+    Shared by the `_generate_and_write_*_keypair` functions. 'serialize_public'
+    and 'serialize_private' are called with 'key_dict' and return the public
+    and unencrypted private key file contents. 'encrypt_private' is called with
+    'key_dict' and the encryption password instead of 'serialize_private', and
+    returns the encrypted private key file contents. See
+    '_generate_and_write_rsa_keypair' for the other arguments and errors.
+
+    """
+    # Use passed 'filepath' or keyid as file name
+    if not filepath:
+        filepath = os.path.join(os.getcwd(), key_dict["keyid"])
+
+    _check_path(filepath)
+
+    password = _get_key_file_encryption_password(password, prompt, filepath)
+
+    # Serialize both keys before writing any of them, encrypting the private
+    # key if a 'password' was passed or entered on the prompt
+    public = serialize_public(key_dict)
+    if password is None:
+        private = serialize_private(key_dict)
+    else:
+        private = encrypt_private(key_dict, password)
+
+    # PEM, JSON written with 'ensure_ascii' and encrypted keys (hex strings)
+    # are all ASCII, so the faster ASCII codec is sufficient to encode them.
+    public_data = public.encode("ascii")
+    private_data = private.encode("ascii")
+
+    # Create intermediate directories as required
+    util.ensure_parent_dir(filepath)
+
+    # Write public key to <filepath>.pub
+    _write_key_file(filepath + ".pub", public_data)
+
+    # Write private key to <filepath>
+    _write_key_file(filepath, private_data, restrict=True)
+
+    return filepath
+
+
 def _generate_and_write_rsa_keypair(
     filepath=None, bits=DEFAULT_RSA_KEY_BITS, password=None, prompt=False
 ):
@@ -207,39 +415,20 @@ def _generate_and_write_rsa_keypair(
       The private key filepath.
 
     """
-    formats.RSAKEYBITS_SCHEMA.check_match(bits)
+    _check_rsabits(bits)
 
-    # Generate private RSA key and extract public and private both in PEM
+    # Generate private RSA key and write public and private both in PEM
     rsa_key = keys.generate_rsa_key(bits)
-    public = rsa_key["keyval"]["public"]
-    private = rsa_key["keyval"]["private"]
-
-    # Use passed 'filepath' or keyid as file name
-    if not filepath:
-        filepath = os.path.join(os.getcwd(), rsa_key["keyid"])
-
-    formats.PATH_SCHEMA.check_match(filepath)
-
-    password = _get_key_file_encryption_password(password, prompt, filepath)
-
-    # Encrypt the private key if a 'password' was passed or entered on the prompt
-    if password is not None:
-        private = keys.create_rsa_encrypted_pem(private, password)
-
-    # Create intermediate directories as required
-    util.ensure_parent_dir(filepath)
 
-    # Write PEM-encoded public key to <filepath>.pub
-    file_object = tempfile.TemporaryFile()
-    file_object.write(public.encode("utf-8"))
-    util.persist_temp_file(file_object, filepath + ".pub")
-
-    # Write PEM-encoded private key to <filepath>
-    file_object = tempfile.TemporaryFile()
-    file_object.write(private.encode("utf-8"))
-    util.persist_temp_file(file_object, filepath, restrict=True)
-
-    return filepath
+    return _write_keypair(
+        rsa_key,
+        filepath,
+        password,
+        prompt,
+        serialize_public=_serialize_rsa_public,
+        serialize_private=_serialize_rsa_private,
+        encrypt_private=_encrypt_rsa_private,
+    )
 
 
 def generate_and_write_rsa_keypair(
@@ -274,7 +463,7 @@ def generate_and_write_rsa_keypair(
       The private key filepath.
 
     """
-    formats.PASSWORD_SCHEMA.check_match(password)
+    _check_password(password)
     return _generate_and_write_rsa_keypair(
         filepath=filepath, bits=bits, password=password, prompt=False
     )
@@ -357,6 +546,8 @@ def import_rsa_privatekey_from_file(
     scheme="rsassa-pss-sha256",
     prompt=False,
     storage_backend=None,
+    *,
+    _validated=False,
 ):
     """Imports PEM-encoded RSA private key from file storage.
 
@@ -385,16 +576,14 @@ def import_rsa_privatekey_from_file(
       An RSA private key object conformant with 'RSAKEY_SCHEMA'.
 
     """
-    formats.PATH_SCHEMA.check_match(filepath)
-    formats.RSA_SCHEME_SCHEMA.check_match(scheme)
+    # Internal callers, which already validated the arguments, skip the checks
+    if not _validated:
+        _check_path(filepath)
+        _check_rsascheme(scheme)
 
     password = _get_key_file_decryption_password(password, prompt, filepath)
 
-    if storage_backend is None:
-        storage_backend = FilesystemBackend()
-
-    with storage_backend.get(filepath) as file_object:
-        pem_key = file_object.read().decode("utf-8")
+    pem_key = _read_key_file(filepath, storage_backend).decode("utf-8")
 
     # Optionally decrypt and convert PEM-encoded key to 'RSAKEY_SCHEMA' format
     rsa_key = keys.import_rsakey_from_private_pem(pem_key, scheme, password)
@@ -426,14 +615,10 @@ def import_rsa_publickey_from_file(
       An RSA public key object conformant with 'RSAKEY_SCHEMA'.
 
     """
-    formats.PATH_SCHEMA.check_match(filepath)
-    formats.RSA_SCHEME_SCHEMA.check_match(scheme)
-
-    if storage_backend is None:
-        storage_backend = FilesystemBackend()
+    _check_path(filepath)
+    _check_rsascheme(scheme)
 
-    with storage_backend.get(filepath) as file_object:
-        rsa_pubkey_pem = file_object.read().decode("utf-8")
+    rsa_pubkey_pem = _read_key_file(filepath, storage_backend).decode("utf-8")
 
     # Convert PEM-encoded key to 'RSAKEY_SCHEMA' format
     try:
@@ -448,7 +633,7 @@ def import_rsa_publickey_from_file(
 
 
 def _generate_and_write_ed25519_keypair(
-    filepath=None, password=None, prompt=False
+    filepath=None, password=None, prompt=False, seed=None
 ):
     """Generates ed25519 key pair and writes custom JSON-formatted keys to disk.
 
@@ -466,6 +651,9 @@ def _generate_and_write_ed25519_keypair(
       prompt (optional): A boolean indicating if the user should be prompted
           for an encryption password. If the user enters an empty password, the
           key is not encrypted.
+      seed (optional): A 32-byte seed to derive the key pair from
+          deterministically. Only meant for tests, a fixed seed must never be
+          used for production keys.
 
     Raises:
       UnsupportedLibraryError: pyca/pynacl or pyca/cryptography is not available.
@@ -483,47 +671,21 @@ def _generate_and_write_ed25519_keypair(
       The private key filepath.
 
     """
-    ed25519_key = keys.generate_ed25519_key()
-
-    # Use passed 'filepath' or keyid as file name
-    if not filepath:
-        filepath = os.path.join(os.getcwd(), ed25519_key["keyid"])
-
-    formats.PATH_SCHEMA.check_match(filepath)
-
-    password = _get_key_file_encryption_password(password, prompt, filepath)
-
-    # Create intermediate directories as required
-    util.ensure_parent_dir(filepath)
+    ed25519_key = keys.generate_ed25519_key(seed=seed)
 
     # Use custom JSON format for ed25519 keys on-disk
-    keytype = ed25519_key["keytype"]
-    keyval = ed25519_key["keyval"]
-    scheme = ed25519_key["scheme"]
-    ed25519key_metadata_format = keys.format_keyval_to_metadata(
-        keytype, scheme, keyval, private=False
+    return _write_keypair(
+        ed25519_key,
+        filepath,
+        password,
+        prompt,
+        serialize_public=_serialize_custom_public,
+        serialize_private=_serialize_custom_private,
+        encrypt_private=keys.encrypt_key,
     )
 
-    # Write public key to <filepath>.pub
-    file_object = tempfile.TemporaryFile()
-    file_object.write(json.dumps(ed25519key_metadata_format).encode("utf-8"))
-    util.persist_temp_file(file_object, filepath + ".pub")
 
-    # Encrypt private key if we have a password, store as JSON string otherwise
-    if password is not None:
-        ed25519_key = keys.encrypt_key(ed25519_key, password)
-    else:
-        ed25519_key = json.dumps(ed25519_key)
-
-    # Write private key to <filepath>
-    file_object = tempfile.TemporaryFile()
-    file_object.write(ed25519_key.encode("utf-8"))
-    util.persist_temp_file(file_object, filepath, restrict=True)
-
-    return filepath
-
-
-def generate_and_write_ed25519_keypair(password, filepath=None):
+def generate_and_write_ed25519_keypair(password, filepath=None, *, seed=None):
     """Generates ed25519 key pair and writes custom JSON-formatted keys to disk.
 
     The private key is encrypted using AES-256 in CTR mode, with the passed
@@ -536,6 +698,9 @@ def generate_and_write_ed25519_keypair(password, filepath=None):
       filepath (optional): The path to write the private key to. If not passed,
           the key is written to CWD using the keyid as filename. The public key
           is written to the same path as the private key using the suffix '.pub'.
+      seed (optional): A 32-byte seed to derive the key pair from
+          deterministically. Only meant for tests, a fixed seed must never be
+          used for production keys.
 
     Raises:
       UnsupportedLibraryError: pyca/pynacl or pyca/cryptography is not available.
@@ -551,9 +716,9 @@ def generate_and_write_ed25519_keypair(password, filepath=None):
       The private key filepath.
 
     """
-    formats.PASSWORD_SCHEMA.check_match(password)
+    _check_password(password)
     return _generate_and_write_ed25519_keypair(
-        filepath=filepath, password=password, prompt=False
+        filepath=filepath, password=password, prompt=False, seed=seed
     )
 
 
@@ -589,7 +754,7 @@ def generate_and_write_ed25519_keypair_with_prompt(filepath=None):
     )
 
 
-def generate_and_write_unencrypted_ed25519_keypair(filepath=None):
+def generate_and_write_unencrypted_ed25519_keypair(filepath=None, *, seed=None):
     """Generates ed25519 key pair and writes custom JSON-formatted keys to disk.
 
     NOTE: The custom key format includes 'ed25519' as signing scheme.
@@ -598,6 +763,9 @@ def generate_and_write_unencrypted_ed25519_keypair(filepath=None):
       filepath (optional): The path to write the private key to. If not passed,
           the key is written to CWD using the keyid as filename. The public key
           is written to the same path as the private key using the suffix '.pub'.
+      seed (optional): A 32-byte seed to derive the key pair from
+          deterministically. Only meant for tests, a fixed seed must never be
+          used for production keys.
 
     Raises:
       UnsupportedLibraryError: pyca/pynacl or pyca/cryptography is not available.
@@ -613,7 +781,7 @@ def generate_and_write_unencrypted_ed25519_keypair(filepath=None):
 
     """
     return _generate_and_write_ed25519_keypair(
-        filepath=filepath, password=None, prompt=False
+        filepath=filepath, password=None, prompt=False, seed=seed
     )
 
 
@@ -634,11 +802,11 @@ def import_ed25519_publickey_from_file(filepath):
       An ed25519 public key object conformant with 'ED25519KEY_SCHEMA'.
 
     """
-    formats.PATH_SCHEMA.check_match(filepath)
+    _check_path(filepath)
 
     # Load custom on-disk JSON formatted key and convert to its custom in-memory
     # dict key representation
-    ed25519_key_metadata = util.load_json_file(filepath)
+    ed25519_key_metadata = _load_json_key_file(filepath)
     ed25519_key, _ = keys.format_metadata_to_key(ed25519_key_metadata)
 
     # Check that the generic loading functions indeed loaded an ed25519 key
@@ -650,7 +818,12 @@ def import_ed25519_publickey_from_file(filepath):
 
 
 def import_ed25519_privatekey_from_file(
-    filepath, password=None, prompt=False, storage_backend=None
+    filepath,
+    password=None,
+    prompt=False,
+    storage_backend=None,
+    *,
+    _validated=False,
 ):
     """Imports custom JSON-formatted ed25519 private key from file storage.
 
@@ -681,20 +854,16 @@ def import_ed25519_privatekey_from_file(
       An ed25519 private key object conformant with 'ED25519KEY_SCHEMA'.
 
     """
-    formats.PATH_SCHEMA.check_match(filepath)
+    # Internal callers, which already validated the arguments, skip the checks
+    if not _validated:
+        _check_path(filepath)
     password = _get_key_file_decryption_password(password, prompt, filepath)
 
-    if storage_backend is None:
-        storage_backend = FilesystemBackend()
-
-    with storage_backend.get(filepath) as file_object:
-        json_str = file_object.read()
+    json_str = _read_key_file(filepath, storage_backend)
 
-        # Load custom on-disk JSON formatted key and convert to its custom
-        # in-memory dict key representation, decrypting it if password is not None
-        return keys.import_ed25519key_from_private_json(
-            json_str, password=password
-        )
+    # Load custom on-disk JSON formatted key and convert to its custom in-memory
+    # dict key representation, decrypting it if password is not None
+    return keys.import_ed25519key_from_private_json(json_str, password=password)
 
 
 def _generate_and_write_ecdsa_keypair(
@@ -735,43 +904,17 @@ def _generate_and_write_ecdsa_keypair(
     """
     ecdsa_key = keys.generate_ecdsa_key()
 
-    # Use passed 'filepath' or keyid as file name
-    if not filepath:
-        filepath = os.path.join(os.getcwd(), ecdsa_key["keyid"])
-
-    formats.PATH_SCHEMA.check_match(filepath)
-
-    password = _get_key_file_encryption_password(password, prompt, filepath)
-
-    # Create intermediate directories as required
-    util.ensure_parent_dir(filepath)
-
     # Use custom JSON format for ecdsa keys on-disk
-    keytype = ecdsa_key["keytype"]
-    keyval = ecdsa_key["keyval"]
-    scheme = ecdsa_key["scheme"]
-    ecdsakey_metadata_format = keys.format_keyval_to_metadata(
-        keytype, scheme, keyval, private=False
+    return _write_keypair(
+        ecdsa_key,
+        filepath,
+        password,
+        prompt,
+        serialize_public=_serialize_custom_public,
+        serialize_private=_serialize_custom_private,
+        encrypt_private=keys.encrypt_key,
     )
 
-    # Write public key to <filepath>.pub
-    file_object = tempfile.TemporaryFile()
-    file_object.write(json.dumps(ecdsakey_metadata_format).encode("utf-8"))
-    util.persist_temp_file(file_object, filepath + ".pub")
-
-    # Encrypt private key if we have a password, store as JSON string otherwise
-    if password is not None:
-        ecdsa_key = keys.encrypt_key(ecdsa_key, password)
-    else:
-        ecdsa_key = json.dumps(ecdsa_key)
-
-    # Write private key to <filepath>
-    file_object = tempfile.TemporaryFile()
-    file_object.write(ecdsa_key.encode("utf-8"))
-    util.persist_temp_file(file_object, filepath, restrict=True)
-
-    return filepath
-
 
 def generate_and_write_ecdsa_keypair(password, filepath=None):
     """Generates ecdsa key pair and writes custom JSON-formatted keys to disk.
@@ -801,7 +944,7 @@ def generate_and_write_ecdsa_keypair(password, filepath=None):
       The private key filepath.
 
     """
-    formats.PASSWORD_SCHEMA.check_match(password)
+    _check_password(password)
     return _generate_and_write_ecdsa_keypair(
         filepath=filepath, password=password, prompt=False
     )
@@ -884,18 +1027,23 @@ def import_ecdsa_publickey_from_file(filepath):
       An ecdsa public key object conformant with 'ECDSAKEY_SCHEMA'.
 
     """
-    formats.PATH_SCHEMA.check_match(filepath)
+    _check_path(filepath)
 
     # Load custom on-disk JSON formatted key and convert to its custom in-memory
     # dict key representation
-    ecdsa_key_metadata = util.load_json_file(filepath)
+    ecdsa_key_metadata = _load_json_key_file(filepath)
     ecdsa_key, _ = keys.format_metadata_to_key(ecdsa_key_metadata)
 
     return ecdsa_key
 
 
 def import_ecdsa_privatekey_from_file(
-    filepath, password=None, prompt=False, storage_backend=None
+    filepath,
+    password=None,
+    prompt=False,
+    storage_backend=None,
+    *,
+    _validated=False,
 ):
     """Imports custom JSON-formatted ecdsa private key from file storage.
 
@@ -924,15 +1072,13 @@ def import_ecdsa_privatekey_from_file(
       An ecdsa private key object conformant with 'ED25519KEY_SCHEMA'.
 
     """
-    formats.PATH_SCHEMA.check_match(filepath)
+    # Internal callers, which already validated the arguments, skip the checks
+    if not _validated:
+        _check_path(filepath)
 
     password = _get_key_file_decryption_password(password, prompt, filepath)
 
-    if storage_backend is None:
-        storage_backend = FilesystemBackend()
-
-    with storage_backend.get(filepath) as file_object:
-        key_data = file_object.read().decode("utf-8")
+    key_data = _read_key_file(filepath, storage_backend)
 
     # Decrypt private key if we have a password, directly load JSON otherwise
     if password is not None:
@@ -1084,6 +1230,160 @@ def import_privatekey_from_file(
         )
 
 
+def _batch_import(import_function, filepaths, password, **kwargs):
+    """Calls 'import_function' for each of 'filepaths' on a thread pool.
+
+    'password' is either None, a single password used for all files, or a list of
+    passwords associated with 'filepaths' by index. 'filepaths' and 'password'
+    are validated once up front, any other arguments must be validated by the
+    caller.
+
+    Key parsing and decryption happen in pyca/cryptography calls into OpenSSL,
+    which release the GIL, so that encrypted keys are decrypted in parallel.
+
+    """
+    formats.PATHS_SCHEMA.check_match(filepaths)
+
+    if password is None or isinstance(password, str):
+        passwords = [password] * len(filepaths)
+
+    else:
+        formats.PASSWORDS_SCHEMA.check_match(password)
+        passwords = password
+
+    if len(passwords) != len(filepaths):
+        raise exceptions.FormatError(
+            "Pass equal amount of 'filepaths' (got {}) and passwords (got {}), "  # pylint: disable=consider-using-f-string
+            "or a single password for all 'filepaths'.".format(
+                len(filepaths), len(passwords)
+            )
+        )
+
+    if not filepaths:
+        return []
+
+    def _import(path_and_password):
+        filepath, file_password = path_and_password
+        return import_function(
+            filepath, password=file_password, _validated=True, **kwargs
+        )
+
+    max_workers = min(len(filepaths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_import, zip(filepaths, passwords)))
+
+
+def import_rsa_privatekeys_from_files(
+    filepaths, password=None, scheme="rsassa-pss-sha256", storage_backend=None
+):
+    """Imports multiple PEM-encoded RSA private keys from file storage.
+
+    Keys are imported in parallel. See 'import_rsa_privatekey_from_file' for
+    details about the expected key format.
+
+    Arguments:
+      filepaths: A list of paths to read the files from.
+      password (optional): A password to decrypt all keys, or a list of
+          passwords associated with 'filepaths' by index.
+      scheme (optional): The signing scheme assigned to the returned key objects.
+          See RSA_SCHEME_SCHEMA for available signing schemes.
+      storage_backend (optional): An object implementing StorageBackendInterface.
+          If not passed a default FilesystemBackend will be used.
+
+    Raises:
+      UnsupportedLibraryError: pyca/cryptography is not available.
+      FormatError: Arguments are malformed, or a list of passwords is passed and
+          does not have the same length as 'filepaths'.
+      StorageError: A key file cannot be read.
+      CryptoError: A key cannot be parsed.
+
+    Returns:
+      A list of RSA private key objects conformant with 'RSAKEY_SCHEMA', in the
+      order of 'filepaths'.
+
+    """
+    _check_rsascheme(scheme)
+    return _batch_import(
+        import_rsa_privatekey_from_file,
+        filepaths,
+        password,
+        scheme=scheme,
+        storage_backend=storage_backend,
+    )
+
+
+def import_ed25519_privatekeys_from_files(
+    filepaths, password=None, storage_backend=None
+):
+    """Imports multiple custom JSON-formatted ed25519 private keys from file
+    storage.
+
+    Keys are imported in parallel. See 'import_ed25519_privatekey_from_file' for
+    details about the expected key format.
+
+    Arguments:
+      filepaths: A list of paths to read the files from.
+      password (optional): A password to decrypt all keys, or a list of
+          passwords associated with 'filepaths' by index.
+      storage_backend (optional): An object implementing StorageBackendInterface.
+          If not passed a default FilesystemBackend will be used.
+
+    Raises:
+      UnsupportedLibraryError: pyca/cryptography is not available.
+      FormatError: Arguments are malformed, or a list of passwords is passed and
+          does not have the same length as 'filepaths'.
+      StorageError: A key file cannot be read.
+      Error, CryptoError: A key cannot be parsed.
+
+    Returns:
+      A list of ed25519 private key objects conformant with 'ED25519KEY_SCHEMA',
+      in the order of 'filepaths'.
+
+    """
+    return _batch_import(
+        import_ed25519_privatekey_from_file,
+        filepaths,
+        password,
+        storage_backend=storage_backend,
+    )
+
+
+def import_ecdsa_privatekeys_from_files(
+    filepaths, password=None, storage_backend=None
+):
+    """Imports multiple custom JSON-formatted ecdsa private keys from file
+    storage.
+
+    Keys are imported in parallel. See 'import_ecdsa_privatekey_from_file' for
+    details about the expected key format.
+
+    Arguments:
+      filepaths: A list of paths to read the files from.
+      password (optional): A password to decrypt all keys, or a list of
+          passwords associated with 'filepaths' by index.
+      storage_backend (optional): An object implementing StorageBackendInterface.
+          If not passed a default FilesystemBackend will be used.
+
+    Raises:
+      UnsupportedLibraryError: pyca/cryptography is not available.
+      FormatError: Arguments are malformed, or a list of passwords is passed and
+          does not have the same length as 'filepaths'.
+      StorageError: A key file cannot be read.
+      Error, CryptoError: A key cannot be parsed.
+
+    Returns:
+      A list of ecdsa private key objects conformant with 'ECDSAKEY_SCHEMA', in
+      the order of 'filepaths'.
+
+    """
+    return _batch_import(
+        import_ecdsa_privatekey_from_file,
+        filepaths,
+        password,
+        storage_backend=storage_backend,
+    )
+
+
 if __name__ == "__main__":
     # The interactive sessions of the documentation strings can
     # be tested by running interface.py as a standalone module:
@@ -276,7 +276,7 @@ def generate_ecdsa_key(scheme="ecdsa-sha2-nistp256"):
     return ecdsa_key
 
 
-def generate_ed25519_key(scheme="ed25519"):
+def generate_ed25519_key(scheme="ed25519", seed=None):
     """
     <Purpose>
       Generate public and private ED25519 keys, both of length 32-bytes, although
@@ -302,8 +302,14 @@ def generate_ed25519_key(scheme="ed25519"):
       scheme:
         The signature scheme used by the generated Ed25519 key.
 
+      seed:
+        An optional 32-byte seed to derive the Ed25519 key from
+        deterministically.  Only meant for tests, a fixed seed must never be
+        used for production keys.
+
     <Exceptions>
-      None.
+      securesystemslib.exceptions.FormatError, if 'seed' is passed and is
+      improperly formatted.
 
     <Side Effects>
       The ED25519 keys are generated by calling either the optimized pure Python
@@ -329,7 +335,7 @@ def generate_ed25519_key(scheme="ed25519"):
     # optimized, pure python implementation provided by PyCA.  Ed25519 should
     # always be generated with a backend like libsodium to prevent side-channel
     # attacks.
-    public, private = ed25519_keys.generate_public_and_private()
+    public, private = ed25519_keys.generate_public_and_private(seed)
 
     # Generate the keyid of the Ed25519 key.  'key_value' corresponds to the
     # 'keyval' entry of the 'Ed25519KEY_SCHEMA' dictionary.  The private key
@@ -1377,7 +1383,8 @@ def decrypt_key(encrypted_key, passphrase):
         An encrypted key (additional data is also included, such as salt, number
         of password iterations used for the derived encryption key, etc) of the
         form 'securesystemslib.formats.ENCRYPTEDKEY_SCHEMA'.  'encrypted_key'
-        should have been generated with encrypt_key().
+        should have been generated with encrypt_key(), and may be passed as str
+        or, e.g. as read from a file, as bytes.
 
       password:
         The password, or passphrase, to decrypt 'encrypted_key'.  'password' is
@@ -1611,7 +1618,7 @@ def import_ed25519key_from_private_json(
         # Decrypt the loaded key file, calling the 'cryptography' library to
         # generate the derived encryption key from 'password'.  Raise
         # 'securesystemslib.exceptions.CryptoError' if the decryption fails.
-        key_object = decrypt_key(json_str.decode("utf-8"), password)
+        key_object = decrypt_key(json_str, password)
 
     else:
         logger.debug(
@@ -1619,7 +1626,7 @@ def import_ed25519key_from_private_json(
             " unencrypted file."
         )
         try:
-            key_object = util.load_json_string(json_str.decode("utf-8"))
+            key_object = util.load_json_string(json_str)
         # If the JSON could not be decoded, it is very likely, but not necessarily,
         # due to a non-empty password.
         except exceptions.Error:
@@ -104,6 +104,12 @@ try:
     from cryptography.hazmat.primitives.serialization import (
         load_pem_private_key,
     )
+
+    # pyca/cryptography's default backend (e.g., openSSL, CommonCrypto, etc.),
+    # fetched once and shared by all calls in this module.  The default backend
+    # is not fixed and can be changed by pyca/cryptography over time.
+    _BACKEND = default_backend()
+
 except ImportError:
     CRYPTO = False
 
@@ -128,6 +134,8 @@ _DEFAULT_RSA_KEY_BITS = 3072
 # arbitrarily chosen and should not occur in the hexadecimal representations of
 # the fields it is separating.
 _ENCRYPTION_DELIMITER = "@@@@"
+# The delimiter as bytes, to split encrypted files without encoding it per call.
+_ENCRYPTION_DELIMITER_BYTES = _ENCRYPTION_DELIMITER.encode("utf-8")
 
 # AES key size.  Default key size = 32 bytes = AES-256.
 _AES_KEY_SIZE = 32
@@ -210,7 +218,7 @@ def generate_rsa_public_and_private(bits=_DEFAULT_RSA_KEY_BITS):
     # and a 2048-bit minimum is enforced by
     # securesystemslib.formats.RSAKEYBITS_SCHEMA.check_match().
     private_key = rsa.generate_private_key(
-        public_exponent=65537, key_size=bits, backend=default_backend()
+        public_exponent=65537, key_size=bits, backend=_BACKEND
     )
 
     # Extract the public & private halves of the RSA key and generate their
@@ -317,7 +325,7 @@ def create_rsa_signature(private_key, data, scheme="rsassa-pss-sha256"):
         private_key_object = load_pem_private_key(
             private_key.encode("utf-8"),
             password=None,
-            backend=default_backend(),
+            backend=_BACKEND,
         )
 
         digest_obj = digest_from_rsa_scheme(scheme, "pyca_crypto")
@@ -457,7 +465,7 @@ def verify_rsa_signature(signature, signature_scheme, public_key, data):
     # Verify the RSASSA-PSS signature with pyca/cryptography.
     try:
         public_key_object = serialization.load_pem_public_key(
-            public_key.encode("utf-8"), backend=default_backend()
+            public_key.encode("utf-8"), backend=_BACKEND
         )
 
         digest_obj = digest_from_rsa_scheme(signature_scheme, "pyca_crypto")
@@ -565,7 +573,7 @@ def create_rsa_encrypted_pem(private_key, passphrase):
             private_key = load_pem_private_key(
                 private_key.encode("utf-8"),
                 password=None,
-                backend=default_backend(),
+                backend=_BACKEND,
             )
         except ValueError:
             raise exceptions.CryptoError(  # pylint: disable=raise-missing-from
@@ -676,7 +684,7 @@ def create_rsa_public_and_private_from_pem(pem, passphrase=None):
     # key.
     try:
         private_key = load_pem_private_key(
-            pem.encode("utf-8"), passphrase, backend=default_backend()
+            pem.encode("utf-8"), passphrase, backend=_BACKEND
         )
 
     # pyca/cryptography's expected exceptions for 'load_pem_private_key()':
@@ -863,7 +871,8 @@ def decrypt_key(encrypted_key, password):
       An encrypted securesystemslib key (additional data is also included, such
       as salt, number of password iterations used for the derived encryption
       key, etc) of the form 'securesystemslib.formats.ENCRYPTEDKEY_SCHEMA'.
-      'encrypted_key' should have been generated with encrypted_key().
+      'encrypted_key' should have been generated with encrypted_key(), and may
+      be passed as str or, e.g. as read from a file, as bytes.
 
     password:
       The password, or passphrase, to encrypt the private part of the RSA
@@ -926,11 +935,6 @@ def _generate_derived_key(password, salt=None, iterations=None):
     '_PBKDF2_ITERATIONS' is used by default.
     """
 
-    # Use pyca/cryptography's default backend (e.g., openSSL, CommonCrypto, etc.)
-    # The default backend is not fixed and can be changed by pyca/cryptography
-    # over time.
-    backend = default_backend()
-
     # If 'salt' and 'iterations' are unspecified, a new derived key is generated.
     # If specified, a deterministic key is derived according to the given
     # 'salt' and 'iterrations' values.
@@ -947,7 +951,7 @@ def _generate_derived_key(password, salt=None, iterations=None):
         length=32,
         salt=salt,
         iterations=iterations,
-        backend=backend,
+        backend=_BACKEND,
     )
 
     derived_key = pbkdf_object.derive(password.encode("utf-8"))
@@ -993,7 +997,7 @@ def _encrypt(key_data, derived_key_information):
     # generated IV.
     symmetric_key = derived_key_information["derived_key"]
     encryptor = Cipher(
-        algorithms.AES(symmetric_key), modes.CTR(iv), backend=default_backend()
+        algorithms.AES(symmetric_key), modes.CTR(iv), backend=_BACKEND
     ).encryptor()
 
     # Encrypt the plaintext and get the associated ciphertext.
@@ -1007,9 +1011,7 @@ def _encrypt(key_data, derived_key_information):
     # a decryption operation.
     symmetric_key = derived_key_information["derived_key"]
     salt = derived_key_information["salt"]
-    hmac_object = hmac.HMAC(
-        symmetric_key, hashes.SHA256(), backend=default_backend()
-    )
+    hmac_object = hmac.HMAC(symmetric_key, hashes.SHA256(), backend=_BACKEND)
     hmac_object.update(ciphertext)
     hmac_value = binascii.hexlify(hmac_object.finalize())
 
@@ -1038,11 +1040,17 @@ def _encrypt(key_data, derived_key_information):
 
 def _decrypt(file_contents, password):
     """
-    The corresponding decryption routine for _encrypt().
+    The corresponding decryption routine for _encrypt().  'file_contents' may
+    be str or bytes.
 
     'securesystemslib.exceptions.CryptoError' raised if the decryption fails.
     """
 
+    # Work on bytes, which is what key files are read as and what
+    # binascii.unhexlify() takes.
+    if isinstance(file_contents, str):
+        file_contents = file_contents.encode("utf-8")
+
     # Extract the salt, iterations, hmac, initialization vector, and ciphertext
     # from 'file_contents'.  These five values are delimited by
     # '_ENCRYPTION_DELIMITER'.  This delimiter is arbitrarily chosen and should
@@ -1051,8 +1059,11 @@ def _decrypt(file_contents, password):
     # 'file_contents' does not contains the expected data layout.
     try:
         salt, iterations, read_hmac, iv, ciphertext = file_contents.split(
-            _ENCRYPTION_DELIMITER
+            _ENCRYPTION_DELIMITER_BYTES
         )
+        # The hmac is compared as str below. Decoding fails with a ValueError
+        # subclass if it is not valid UTF-8.
+        read_hmac = read_hmac.decode()
 
     except ValueError:
         raise exceptions.CryptoError(  # pylint: disable=raise-missing-from
@@ -1060,10 +1071,10 @@ def _decrypt(file_contents, password):
         )
 
     # Ensure we have the expected raw data for the delimited cryptographic data.
-    salt = binascii.unhexlify(salt.encode("utf-8"))
+    salt = binascii.unhexlify(salt)
     iterations = int(iterations)
-    iv = binascii.unhexlify(iv.encode("utf-8"))
-    ciphertext = binascii.unhexlify(ciphertext.encode("utf-8"))
+    iv = binascii.unhexlify(iv)
+    ciphertext = binascii.unhexlify(ciphertext)
 
     # Generate derived key from 'password'.  The salt and iterations are
     # specified so that the expected derived key is regenerated correctly.
@@ -1080,7 +1091,7 @@ def _decrypt(file_contents, password):
     # The decryption routine may verify a ciphertext without having to perform
     # a decryption operation.
     generated_hmac_object = hmac.HMAC(
-        symmetric_key, hashes.SHA256(), backend=default_backend()
+        symmetric_key, hashes.SHA256(), backend=_BACKEND
     )
     generated_hmac_object.update(ciphertext)
     generated_hmac = binascii.hexlify(generated_hmac_object.finalize())
@@ -1090,7 +1101,7 @@ def _decrypt(file_contents, password):
 
     # Construct a Cipher object, with the key and iv.
     decryptor = Cipher(
-        algorithms.AES(symmetric_key), modes.CTR(iv), backend=default_backend()
+        algorithms.AES(symmetric_key), modes.CTR(iv), backend=_BACKEND
     ).decryptor()
 
     # Decryption gets us the authenticated plaintext.
@@ -47,6 +47,25 @@ class TestEd25519_keys(
             True, securesystemslib.formats.ED25519SEED_SCHEMA.matches(priv)
         )
 
+        # Check that a passed seed is used as private key and that the key pair
+        # is derived deterministically.
+        seed = os.urandom(32)
+        pub, priv = securesystemslib.ed25519_keys.generate_public_and_private(
+            seed
+        )
+        self.assertEqual(priv, seed)
+        self.assertEqual(
+            (pub, priv),
+            securesystemslib.ed25519_keys.generate_public_and_private(seed),
+        )
+
+        # Check for invalid seed.
+        self.assertRaises(
+            securesystemslib.exceptions.FormatError,
+            securesystemslib.ed25519_keys.generate_public_and_private,
+            b"too short",
+        )
+
     def test_create_signature(self):
         global public  # pylint: disable=global-variable-not-assigned
         global private  # pylint: disable=global-variable-not-assigned
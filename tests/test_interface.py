@@ -46,11 +46,13 @@ from securesystemslib.exceptions import (  # pylint: disable=wrong-import-positi
     CryptoError,
     Error,
     FormatError,
+    StorageError,
 )
 from securesystemslib.formats import (  # pylint: disable=wrong-import-position
     ANY_PUBKEY_DICT_SCHEMA,
     ECDSAKEY_SCHEMA,
     ED25519KEY_SCHEMA,
+    PATH_SCHEMA,
     PUBLIC_KEY_SCHEMA,
     RSAKEY_SCHEMA,
 )
@@ -68,15 +70,24 @@ from securesystemslib.interface import (  # pylint: disable=wrong-import-positio
     generate_and_write_unencrypted_ed25519_keypair,
     generate_and_write_unencrypted_rsa_keypair,
     import_ecdsa_privatekey_from_file,
+    import_ecdsa_privatekeys_from_files,
     import_ecdsa_publickey_from_file,
     import_ed25519_privatekey_from_file,
+    import_ed25519_privatekeys_from_files,
     import_ed25519_publickey_from_file,
     import_privatekey_from_file,
     import_publickeys_from_file,
     import_rsa_privatekey_from_file,
+    import_rsa_privatekeys_from_files,
     import_rsa_publickey_from_file,
 )
 
+# orjson is an optional parser for JSON key files, test it if it is installed
+try:
+    from orjson import loads as orjson_loads
+except ImportError:
+    orjson_loads = None
+
 
 class TestInterfaceFunctions(
     unittest.TestCase
@@ -386,6 +397,36 @@ class TestInterfaceFunctions(
         # NOTE: There is no private key schema, at least check it has a value
         self.assertTrue(priv["keyval"]["private"])
 
+        # TEST: Public key file is written as compact JSON
+        # Assert no whitespace after separators (file loaded above)
+        with open(fn_default + ".pub", encoding="ascii") as file_object:
+            key_json = file_object.read()
+        self.assertNotIn(", ", key_json)
+        self.assertNotIn(": ", key_json)
+
+        # TEST: Unencrypted private key file is written as compact JSON
+        # Assert no whitespace after separators (file loaded above)
+        with open(fn_default, encoding="ascii") as file_object:
+            key_json = file_object.read()
+        self.assertNotIn(", ", key_json)
+        self.assertNotIn(": ", key_json)
+
+        # TEST: Generate keys from seed
+        # Assert same seed yields same key, with and without encryption
+        seed = b"\x01" * 32
+        fn_seed = generate_and_write_unencrypted_ed25519_keypair(
+            "seed", seed=seed
+        )
+        fn_seed_encrypted = generate_and_write_ed25519_keypair(
+            "pw", "seed_encrypted", seed=seed
+        )
+        priv_seed = import_ed25519_privatekey_from_file(fn_seed)
+        self.assertEqual(priv_seed["keyval"]["private"], seed.hex())
+        self.assertEqual(
+            priv_seed,
+            import_ed25519_privatekey_from_file(fn_seed_encrypted, "pw"),
+        )
+
         # TEST: Generate unencrypted keys with empty prompt
         # Assert importable with empty prompt password and without password
         fn_empty_prompt = "empty_prompt"
@@ -638,6 +679,20 @@ class TestInterfaceFunctions(
         # NOTE: There is no private key schema, at least check it has a value
         self.assertTrue(priv["keyval"]["private"])
 
+        # TEST: Public key file is written as compact JSON
+        # Assert no whitespace after separators (file loaded above)
+        with open(fn_default + ".pub", encoding="ascii") as file_object:
+            key_json = file_object.read()
+        self.assertNotIn(", ", key_json)
+        self.assertNotIn(": ", key_json)
+
+        # TEST: Unencrypted private key file is written as compact JSON
+        # Assert no whitespace after separators (file loaded above)
+        with open(fn_default, encoding="ascii") as file_object:
+            key_json = file_object.read()
+        self.assertNotIn(", ", key_json)
+        self.assertNotIn(": ", key_json)
+
         # TEST: Generate unencrypted keys with empty prompt
         # Assert importable with empty prompt password and without password
         fn_empty_prompt = "empty_prompt"
@@ -858,7 +913,7 @@ class TestInterfaceFunctions(
         with self.assertRaises(FormatError):
             import_ecdsa_privatekey_from_file(fn_default, prompt="not-a-bool")
 
-    def test_generate_keypair_wrappers(self):
+    def test_generate_keypair_wrappers(self):  # pylint: disable=too-many-locals
         """Basic tests for thin wrappers around _generate_and_write_*_keypair.
         See 'test_rsa', 'test_ed25519' and 'test_ecdsa' for more thorough key
         generation tests for each key type.
@@ -941,6 +996,29 @@ class TestInterfaceFunctions(
                 os.stat(fn_unencrypted).st_mode, expected_priv_mode
             )
 
+            # Test that no temporary files are left behind
+            self.assertFalse(
+                [name for name in os.listdir() if name.endswith(".tmp")],
+                assert_msg,
+            )
+
+            # Test that temporary files are removed if writing fails, also on
+            # errors other than OSError
+            for error, expected_error in [
+                (OSError, StorageError),
+                (KeyboardInterrupt, KeyboardInterrupt),
+            ]:
+                with mock.patch(
+                    "securesystemslib.interface.os.fsync", side_effect=error
+                ):
+                    with self.assertRaises(expected_error, msg=assert_msg):
+                        gen_plain("interrupted")
+                self.assertFalse(
+                    [name for name in os.listdir() if name.endswith(".tmp")],
+                    assert_msg,
+                )
+                self.assertFalse(os.path.exists("interrupted.pub"), assert_msg)
+
     def test_import_publickeys_from_file(self):
         """Test import multiple public keys with different types."""
 
@@ -1037,6 +1115,199 @@ class TestInterfaceFunctions(
                 self.path_rsa, key_type="KEY_TYPE_UNSUPPORTED", password=pw
             )
 
+    def test_import_privatekeys_from_files(self):
+        """Test batch private key import functions."""
+
+        pw = "password"
+        for idx, (
+            path,
+            generate_function,
+            import_function,
+            key_schema,
+        ) in enumerate(
+            [
+                (
+                    self.path_rsa,
+                    _generate_and_write_rsa_keypair,
+                    import_rsa_privatekeys_from_files,
+                    RSAKEY_SCHEMA,
+                ),
+                (
+                    self.path_ed25519,
+                    _generate_and_write_ed25519_keypair,
+                    import_ed25519_privatekeys_from_files,
+                    ED25519KEY_SCHEMA,
+                ),
+                (
+                    self.path_ecdsa,
+                    _generate_and_write_ecdsa_keypair,
+                    import_ecdsa_privatekeys_from_files,
+                    ECDSAKEY_SCHEMA,
+                ),
+            ]
+        ):
+            # Keys generated without 'filepath' are named after their keyid
+            path_other = generate_function(password=pw)
+            paths_unencrypted = [generate_function(), generate_function()]
+
+            keyid = import_function([path], password=pw)[0]["keyid"]
+            keyid_other = os.path.basename(path_other)
+
+            # Successfully import keys with a single password and with a list of
+            # per-file passwords, and preserve the order of the passed paths
+            for password in [pw, [pw, pw, pw]]:
+                imported_keys = import_function(
+                    [path, path_other, path], password=password
+                )
+                for key in imported_keys:
+                    self.assertTrue(
+                        key_schema.matches(key),
+                        "(row {})".format(  # pylint: disable=consider-using-f-string
+                            idx
+                        ),
+                    )
+                self.assertEqual(
+                    [key["keyid"] for key in imported_keys],
+                    [keyid, keyid_other, keyid],
+                )
+
+            # Successfully import unencrypted keys without password
+            imported_keys = import_function(paths_unencrypted, password=None)
+            self.assertEqual(
+                [key["keyid"] for key in imported_keys],
+                [os.path.basename(p) for p in paths_unencrypted],
+            )
+
+            # Import nothing if no paths are passed
+            self.assertEqual(import_function([], password=pw), [])
+
+            # Error on malformed 'filepaths' or 'password'
+            for filepaths, password in [
+                (path, pw),
+                ([path, 1], pw),
+                ([path], 1),
+                ([path], [1]),
+                ([path], {path: pw}),
+            ]:
+                with self.assertRaises(
+                    FormatError,
+                    msg="(row {})".format(  # pylint: disable=consider-using-f-string
+                        idx
+                    ),
+                ):
+                    import_function(filepaths, password=password)
+
+            # Error on password list of mismatching length
+            with self.assertRaises(FormatError):
+                import_function([path] * 3, password=[pw, pw])
+
+            # Error on wrong password for one of the keys
+            with self.assertRaises(CryptoError):
+                import_function([path, path], password=[pw, "bad pw"])
+
+    def test_import_privatekeys_from_files_validation(self):
+        """Test batch import validates paths once instead of per file."""
+
+        pw = "password"
+        for idx, (path, import_function, batch_import_function) in enumerate(
+            [
+                (
+                    self.path_rsa,
+                    import_rsa_privatekey_from_file,
+                    import_rsa_privatekeys_from_files,
+                ),
+                (
+                    self.path_ed25519,
+                    import_ed25519_privatekey_from_file,
+                    import_ed25519_privatekeys_from_files,
+                ),
+                (
+                    self.path_ecdsa,
+                    import_ecdsa_privatekey_from_file,
+                    import_ecdsa_privatekeys_from_files,
+                ),
+            ]
+        ):
+            msg = "(row {})".format(  # pylint: disable=consider-using-f-string
+                idx
+            )
+            with mock.patch(
+                "securesystemslib.interface._check_path",
+                side_effect=PATH_SCHEMA.check_match,
+            ) as check_path:
+                # Batch import does not re-validate each path ...
+                batch_import_function([path] * 3, password=pw)
+                check_path.assert_not_called()
+
+                # ... but direct calls of the single file import do
+                import_function(path, password=pw)
+                check_path.assert_called_once_with(path)
+
+                with self.assertRaises(FormatError, msg=msg):
+                    import_function(1, password=pw)
+
+    def test_import_oversized_key_file(self):
+        """Test refusing to import keys from oversized files."""
+
+        fn_large = "large"
+        with open(fn_large, "wb") as file_object:
+            file_object.write(b"0" * (1024 * 1024 + 1))
+
+        for idx, import_function in enumerate(
+            [
+                import_rsa_publickey_from_file,
+                import_rsa_privatekey_from_file,
+                import_ed25519_publickey_from_file,
+                import_ed25519_privatekey_from_file,
+                import_ecdsa_publickey_from_file,
+                import_ecdsa_privatekey_from_file,
+            ]
+        ):
+            with self.assertRaises(
+                StorageError,
+                msg="(row {})".format(  # pylint: disable=consider-using-f-string
+                    idx
+                ),
+            ):
+                import_function(fn_large)
+
+    def test_import_json_publickey_parsers(self):
+        """Test JSON public key import with json and, if available, orjson."""
+
+        parsers = [json.loads]
+        if orjson_loads is not None:
+            parsers.append(orjson_loads)
+
+        fn_malformed = "malformed"
+        fn_non_utf8 = "non_utf8"
+        with open(fn_malformed, "wb") as file_object:
+            file_object.write(b"not json")
+        with open(fn_non_utf8, "wb") as file_object:
+            file_object.write(b"\xff")
+
+        for import_function, path in [
+            (import_ed25519_publickey_from_file, self.path_ed25519 + ".pub"),
+            (import_ecdsa_publickey_from_file, self.path_ecdsa + ".pub"),
+        ]:
+            expected_key = import_function(path)
+
+            for parser in parsers:
+                msg = "({}, {}.{})".format(  # pylint: disable=consider-using-f-string
+                    import_function.__name__,
+                    parser.__module__,
+                    parser.__name__,
+                )
+                with mock.patch(
+                    "securesystemslib.interface._json_loads", parser
+                ):
+                    # Successfully import key with the patched parser
+                    self.assertEqual(import_function(path), expected_key, msg)
+
+                    # Error on malformed key files
+                    for fn in [fn_malformed, fn_non_utf8]:
+                        with self.assertRaises(Error, msg=msg):
+                            import_function(fn)
+
 
 # Run the test cases.
 if __name__ == "__main__":
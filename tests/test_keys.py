@@ -826,6 +826,23 @@ class TestKeys(unittest.TestCase):  # pylint: disable=missing-class-docstring
             securesystemslib.formats.ANYKEY_SCHEMA.matches(decrypted_key)
         )
 
+        # Test encrypted key passed as bytes.
+        self.assertEqual(
+            KEYS.decrypt_key(encrypted_key.encode("utf-8"), passphrase),
+            decrypted_key,
+        )
+
+        # Test encrypted key passed as bytes with a hmac that is not UTF-8.
+        salt, iterations, _, iv, ciphertext = encrypted_key.encode(
+            "utf-8"
+        ).split(b"@@@@")
+        self.assertRaises(
+            securesystemslib.exceptions.CryptoError,
+            KEYS.decrypt_key,
+            b"@@@@".join([salt, iterations, b"\xff" * 64, iv, ciphertext]),
+            passphrase,
+        )
+
         # Test improperly formatted arguments.
         self.assertRaises(
             securesystemslib.exceptions.FormatError,